@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Application bootstrap shared by the entry points
+Sets up console encoding and import paths, shows the splash screen and
+then loads the main window module
+"""
+
+import sys
+import os
+import importlib
+
+
+def _app_root():
+    """Return the project root (the directory containing src/)"""
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _configure_stdio():
+    """Force UTF-8 stdout/stderr to avoid Windows GBK encode errors with emojis"""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    if hasattr(sys.stderr, "reconfigure"):
+        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+
+def run():
+    """Start the application"""
+    _configure_stdio()
+
+    # Add src directory to Python path
+    sys.path.insert(0, os.path.join(_app_root(), 'src'))
+
+    # Only the splash widgets are imported up front; the main window module
+    # pulls in the rest of Qt, mitmproxy helpers and requests, so it is loaded
+    # after the splash has been painted.
+    from PyQt5.QtWidgets import QApplication, QLabel
+    from PyQt5.QtCore import Qt
+    from src.config.languages import _
+
+    app = QApplication(sys.argv)
+    # A styled label paints the solid background itself, so no full-size
+    # pixmap has to be allocated and filled before the heavy import
+    splash = QLabel(_('app_title'))
+    splash.setWindowFlags(Qt.SplashScreen | Qt.FramelessWindowHint)
+    splash.setAlignment(Qt.AlignCenter)
+    splash.setFixedSize(480, 240)
+    splash.setStyleSheet("background-color: #1e1e2e; color: #cdd6f4;")
+    splash.show()
+    app.processEvents()
+
+    # Import and run the main application
+    main = importlib.import_module("src.core.warp_account_manager").main
+    main(splash=splash)
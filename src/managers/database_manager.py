@@ -7,8 +7,34 @@ Handles all database operations for accounts and proxy settings
 """
 
 import json
+import os
 import sqlite3
 from typing import Tuple, List, Optional
+from src.utils.utils import json_loads
+
+
+def _expiration_of(account_data) -> Optional[int]:
+    """Token expiration (epoch ms) of a parsed account, or None if missing or malformed"""
+    try:
+        return int(account_data['stsTokenManager']['expirationTime'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _token_update(email: str, new_token_data: dict) -> Tuple[str, tuple]:
+    """UPDATE that patches stsTokenManager fields inside account_data with json_set, and its parameters"""
+    keys = sorted(new_token_data)
+    query = f'''
+        UPDATE accounts
+        SET account_data = json_set(account_data, {', '.join('?, ?' for _ in keys)}),
+            expiration_time = COALESCE(?, expiration_time), last_updated = CURRENT_TIMESTAMP
+        WHERE email = ? AND json_type(account_data, '$.stsTokenManager') = 'object'
+    '''
+    params = []
+    for key in keys:
+        params += [f'$.stsTokenManager.{key}', new_token_data[key]]
+    params += [_expiration_of({'stsTokenManager': new_token_data}), email]
+    return query, tuple(params)
 
 
 class DatabaseManager:
@@ -20,12 +46,34 @@ class DatabaseManager:
     def __init__(self, db_path: str = "accounts.db"):
         """Initialize database manager with database path"""
         self.db_path = db_path
+        # Bumped after every write to accounts; part of the cached account list key
+        self._rev = 0
+        self._accounts_cache = (None, None)
         self.init_database()
 
+    def _data_version(self) -> tuple:
+        """Cache key that changes on any write, including other connections and processes"""
+        # In WAL mode every commit touches the -wal file and checkpoints touch the db file
+        version = [self._rev]
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                st = os.stat(path)
+                version += [st.st_mtime_ns, st.st_size]
+            except OSError:
+                version += [None, None]
+        return tuple(version)
+
     def init_database(self):
         """Initialize database and create tables"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+
+        # Write-ahead logging: fewer fsyncs per commit and readers (the proxy
+        # script) no longer block writers. The mode is persisted in the file.
+        try:
+            cursor.execute('PRAGMA journal_mode=WAL')
+        except sqlite3.OperationalError as e:
+            print(f"Database journal mode warning: {e}")
         
         # Create accounts table
         cursor.execute('''
@@ -35,7 +83,8 @@ class DatabaseManager:
                 account_data TEXT NOT NULL,
                 health_status TEXT DEFAULT 'healthy',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expiration_time INTEGER
             )
         ''')
 
@@ -84,6 +133,27 @@ class DatabaseManager:
                     
         except sqlite3.OperationalError as e:
             print(f"limit_info column migration warning: {e}")
+
+        # Add expiration_time column (token expiry in epoch ms, mirrored from account_data)
+        try:
+            cursor.execute("PRAGMA table_info(accounts)")
+            columns = [column[1] for column in cursor.fetchall()]
+
+            if 'expiration_time' not in columns:
+                cursor.execute('ALTER TABLE accounts ADD COLUMN expiration_time INTEGER')
+                # Backfill once from the stored JSON
+                cursor.execute('SELECT email, account_data FROM accounts')
+                backfill = []
+                for email, account_json in cursor.fetchall():
+                    try:
+                        backfill.append((_expiration_of(json_loads(account_json)), email))
+                    except ValueError:
+                        continue
+                cursor.executemany('UPDATE accounts SET expiration_time = ? WHERE email = ?', backfill)
+                conn.commit()
+                print("✅ Added expiration_time column to accounts table")
+        except sqlite3.OperationalError as e:
+            print(f"expiration_time column migration warning: {e}")
         
         # Create proxy settings table
         cursor.execute('''
@@ -106,7 +176,7 @@ class DatabaseManager:
     def add_account(self, account_json: str) -> Tuple[bool, str]:
         """Add or update account in database"""
         try:
-            account_data = json.loads(account_json)
+            account_data = json_loads(account_json)
             email = account_data.get('email')
             
             if not email:
@@ -122,19 +192,21 @@ class DatabaseManager:
             if existing:
                 # Update existing account (don't change created_at)
                 cursor.execute(
-                    "UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP WHERE email = ?",
-                    (account_json, email)
+                    "UPDATE accounts SET account_data = ?, expiration_time = ?, last_updated = CURRENT_TIMESTAMP WHERE email = ?",
+                    (account_json, _expiration_of(account_data), email)
                 )
                 conn.commit()
+                self._rev += 1
                 conn.close()
                 return True, f"Account {email} updated"
             else:
                 # Add new account (set created_at to current time)
                 cursor.execute(
-                    "INSERT INTO accounts (email, account_data, health_status, created_at) VALUES (?, ?, ?, datetime('now'))",
-                    (email, account_json, 'healthy')
+                    "INSERT INTO accounts (email, account_data, health_status, expiration_time, created_at) VALUES (?, ?, ?, ?, datetime('now'))",
+                    (email, account_json, 'healthy', _expiration_of(account_data))
                 )
                 conn.commit()
+                self._rev += 1
                 conn.close()
                 return True, f"Account {email} added"
                 
@@ -179,6 +251,12 @@ class DatabaseManager:
 
     def get_accounts_with_health_and_limits(self) -> List[Tuple[str, str, str, str]]:
         """Get all accounts with health status and limits (email, account_data, health_status, limit_info) sorted by creation date"""
+        # Served from memory until anyone writes to the database (see _data_version)
+        version = self._data_version()
+        cached_version, cached = self._accounts_cache
+        if cached_version == version:
+            return list(cached)
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -189,6 +267,54 @@ class DatabaseManager:
             # Fallback to email sorting if created_at doesn't exist
             cursor.execute('SELECT email, account_data, health_status, limit_info FROM accounts ORDER BY email')
             
+        accounts = cursor.fetchall()
+        conn.close()
+        self._accounts_cache = (version, accounts)
+        return list(accounts)
+
+    def get_accounts_for_display(self) -> List[Tuple[str, str, str, str, int]]:
+        """Get all accounts with health, limits and is_active (1 for the active account) in one query"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        query = '''
+            SELECT a.email, a.account_data, a.health_status, a.limit_info, ps.value IS NOT NULL
+            FROM accounts a
+            LEFT JOIN proxy_settings ps ON ps.key = 'active_account' AND ps.value = a.email
+        '''
+
+        # Check if created_at column exists
+        try:
+            cursor.execute(query + 'ORDER BY a.created_at DESC')
+        except sqlite3.OperationalError:
+            # Fallback to email sorting if created_at doesn't exist
+            cursor.execute(query + 'ORDER BY a.email')
+
+        accounts = cursor.fetchall()
+        conn.close()
+        return accounts
+
+    def get_account_with_health(self, email: str) -> Optional[Tuple[str, str]]:
+        """Get (account_data, health_status) for a single account by email"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('SELECT account_data, health_status FROM accounts WHERE email = ?', (email,))
+            result = cursor.fetchone()
+            conn.close()
+            return result
+        except sqlite3.Error:
+            return None
+
+    def get_expiring_accounts(self, deadline_ms: int) -> List[Tuple[str, str]]:
+        """Get (email, account_data) of non-banned accounts whose token expires by deadline_ms"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        # Rows without a known expiration are included so the caller can check them
+        cursor.execute('''
+            SELECT email, account_data FROM accounts
+            WHERE health_status != 'banned'
+              AND (expiration_time IS NULL OR expiration_time <= ?)
+        ''', (deadline_ms,))
         accounts = cursor.fetchall()
         conn.close()
         return accounts
@@ -203,6 +329,7 @@ class DatabaseManager:
                 WHERE email = ?
             ''', (health_status, email))
             conn.commit()
+            self._rev += 1
             conn.close()
             return True
         except Exception as e:
@@ -214,35 +341,45 @@ class DatabaseManager:
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            cursor.execute('SELECT account_data FROM accounts WHERE email = ?', (email,))
-            result = cursor.fetchone()
-
-            if result:
-                account_data = json.loads(result[0])
-                account_data['stsTokenManager'].update(new_token_data)
-
-                cursor.execute('''
-                    UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP
-                    WHERE email = ?
-                ''', (json.dumps(account_data), email))
-                conn.commit()
-                conn.close()
-                return True
-            return False
+            # SQLite patches the token fields in place; the rest of the blob is not decoded
+            cursor.execute(*_token_update(email, new_token_data))
+            updated = cursor.rowcount > 0
+            conn.commit()
+            self._rev += 1
+            conn.close()
+            return updated
         except Exception as e:
             print(f"Token update error: {e}")
             return False
 
+    def update_account_tokens_bulk(self, updates: List[Tuple[str, dict]]) -> int:
+        """Update token information of several accounts in a single transaction"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            updated = 0
+            for email, new_token_data in updates:
+                cursor.execute(*_token_update(email, new_token_data))
+                updated += cursor.rowcount
+            conn.commit()
+            self._rev += 1
+            conn.close()
+            return updated
+        except Exception as e:
+            print(f"Bulk token update error: {e}")
+            return 0
+
     def update_account(self, email: str, updated_json: str) -> bool:
         """Update complete account information (as JSON string)"""
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute('''
-                UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP
+                UPDATE accounts SET account_data = ?, expiration_time = ?, last_updated = CURRENT_TIMESTAMP
                 WHERE email = ?
-            ''', (updated_json, email))
+            ''', (updated_json, _expiration_of(json_loads(updated_json)), email))
             conn.commit()
+            self._rev += 1
             conn.close()
             return True
         except Exception as e:
@@ -259,6 +396,7 @@ class DatabaseManager:
                 WHERE email = ?
             ''', (limit_info, email))
             conn.commit()
+            self._rev += 1
             conn.close()
             return True
         except Exception as e:
@@ -281,6 +419,7 @@ class DatabaseManager:
                 cursor.execute('DELETE FROM proxy_settings WHERE key = ?', ('active_account',))
 
             conn.commit()
+            self._rev += 1
             conn.close()
             return True
         except Exception as e:
@@ -20,8 +20,15 @@ from src.config.languages import _
 import threading
 from queue import Queue
 
+# Lines printed by warp_proxy_script.py when it bans the active account
+_BANNED_PREFIX = "Account marked as banned: "
+_BAN_NOTICE_PREFIX = "Ban notification file created"
+
+
 class _LogEmitter(QObject):
     log = pyqtSignal(str)
+    account_banned = pyqtSignal(str)  # email, sent once ban_notification.tmp is written
+    proxy_stopped = pyqtSignal()  # the supervised mitmdump process exited on its own
 
 
 class MitmProxyManager:
@@ -39,6 +46,7 @@ class MitmProxyManager:
         self.debug_mode = False  # Use embedded console instead of external window
         self.cert_manager = CertificateManager()
         self._terminal_opened = False  # Track if terminal window was opened
+        self.supervised = False  # True while a thread waits on self.process (see _start_supervisor)
         self.mitmdump_path = self._find_mitmdump()
         # Runtime options
         self.verbose_console = self._detect_verbose_console()
@@ -219,6 +227,7 @@ class MitmProxyManager:
                 self._emit_log(parent_window, f"Mitmproxy command: {' '.join(cmd)}")
                 self._emit_log(parent_window, "Waiting for mitmproxy output...")
                 self._start_log_reader(parent_window)
+                self._start_supervisor()
 
                 # Windows start command returns immediately, so check port
                 print("Starting Mitmproxy, checking port...")
@@ -230,6 +239,11 @@ class MitmProxyManager:
                     print(f"Checking port... ({i+1}/10)")
 
                 print("Failed to start Mitmproxy - port did not open")
+                # Detach first so the supervisor thread does not report this exit
+                process, self.process = self.process, None
+                self.supervised = False
+                if process.poll() is None:
+                    process.terminate()
                 return False
             else:
                 # Linux/Mac startup
@@ -278,7 +292,9 @@ class MitmProxyManager:
                 else:
                     print("Normal mode - Mitmproxy will run in background")
                     # Run in background but capture errors for diagnosis
-                    self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                    env = os.environ.copy()
+                    env.setdefault('PYTHONUNBUFFERED', '1')
+                    self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
                     
                 # Wait a bit and check if process is still running
                 time.sleep(2)
@@ -306,6 +322,11 @@ class MitmProxyManager:
                 
                 if self.process and self.process.poll() is None:
                     print(f"Mitmproxy started successfully (PID: {self.process.pid})")
+
+                    # Drain output so the pipes never fill and ban notices reach the UI
+                    if not self._terminal_opened:
+                        self._start_log_reader(parent_window)
+                        self._start_supervisor()
                     
                     # On macOS, proactively check for TLS issues if in debug mode
                     if sys.platform == "darwin" and self.debug_mode:
@@ -352,11 +373,17 @@ class MitmProxyManager:
 
     def _start_log_reader(self, parent_window=None):
         def reader(stream):
+            banned_email = ''
             try:
                 for line in iter(stream.readline, ''):
                     if not line:
                         break
-                    self._emit_log(parent_window, line.rstrip())
+                    line = line.rstrip()
+                    if line.startswith(_BANNED_PREFIX):
+                        banned_email = line[len(_BANNED_PREFIX):].strip()
+                    elif line.startswith(_BAN_NOTICE_PREFIX):
+                        self.log_emitter.account_banned.emit(banned_email)
+                    self._emit_log(parent_window, line)
             except Exception as e:
                 self._emit_log(parent_window, f"[log reader error] {e}")
         if self.process and self.process.stdout:
@@ -364,6 +391,20 @@ class MitmProxyManager:
         if self.process and self.process.stderr:
             threading.Thread(target=reader, args=(self.process.stderr,), daemon=True).start()
 
+    def _start_supervisor(self):
+        """Wait on the mitmdump process in a daemon thread and emit proxy_stopped when it exits"""
+        process = self.process
+
+        def supervise():
+            process.wait()
+            # stop() detaches self.process first, so only unexpected exits are reported
+            if self.process is process:
+                self.supervised = False
+                self.log_emitter.proxy_stopped.emit()
+
+        self.supervised = True
+        threading.Thread(target=supervise, daemon=True).start()
+
     def _pump_logs(self):
         # No longer needed; logs are emitted directly to UI thread
         pass
@@ -574,8 +615,11 @@ class MitmProxyManager:
         """Stop Mitmproxy"""
         try:
             if self.process and self.process.poll() is None:
-                self.process.terminate()
-                self.process.wait(timeout=10)
+                # Detach first so the supervisor thread does not report this exit
+                process, self.process = self.process, None
+                self.supervised = False
+                process.terminate()
+                process.wait(timeout=10)
                 print("Mitmproxy остановлен")
                 return True
 
@@ -601,6 +645,10 @@ class MitmProxyManager:
             if self.process and self.process.poll() is None:
                 return True
 
+            # A listening proxy port is enough; avoid scanning every process
+            if self.port and self.is_port_open("127.0.0.1", self.port):
+                return True
+
             # Check by PID
             for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
                 try:
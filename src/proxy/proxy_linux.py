@@ -9,6 +9,7 @@ import subprocess
 import os
 import tempfile
 import platform
+from functools import lru_cache
 
 
 class LinuxProxyManager:
@@ -188,6 +189,7 @@ class LinuxProxyManager:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_os_info():
         """Get Linux OS information for API headers"""
         return {
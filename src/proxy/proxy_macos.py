@@ -9,6 +9,7 @@ import subprocess
 import tempfile
 import os
 import platform
+from functools import lru_cache
 
 
 class MacOSProxyManager:
@@ -267,6 +268,7 @@ class MacOSProxyManager:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_os_info():
         """Get macOS OS information for API headers"""
         return {
@@ -7,6 +7,7 @@ Windows-specific proxy management functionality
 
 import subprocess
 import os
+from functools import lru_cache
 
 
 class WindowsProxyManager:
@@ -102,6 +103,7 @@ class WindowsProxyManager:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_os_info():
         """Get Windows OS information for API headers"""
         import platform
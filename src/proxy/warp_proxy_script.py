@@ -142,7 +142,7 @@ class WarpProxyHandler:
 
             old_email = self.active_email
 
-            current_time = int(time.time() * 1000)
+            current_time = time.time_ns() // 1_000_000
             token_expiry = account_data['stsTokenManager']['expirationTime']
             # Convert to int if it's a string
             if isinstance(token_expiry, str):
@@ -181,24 +181,27 @@ class WarpProxyHandler:
             trigger_file = "account_change_trigger.tmp"
             import os
 
-            if os.path.exists(trigger_file):
-                # Check file modification time
-                mtime = os.path.getmtime(trigger_file)
-                if mtime > self.last_trigger_check:
-                    print("🔄 Account change trigger detected!")
-                    self.last_trigger_check = mtime
-
-                    # Delete trigger file
-                    try:
-                        os.remove(trigger_file)
-                        print("🗑️  Trigger file deleted")
-                    except Exception as e:
-                        print(f"Error deleting trigger file: {e}")
-
-                    # Update token
-                    print("🔄 Updating token...")
-                    self.update_active_token()
-                    return True
+            # A single stat() per request: no file means no pending change
+            try:
+                mtime = os.stat(trigger_file).st_mtime
+            except FileNotFoundError:
+                return False
+
+            if mtime > self.last_trigger_check:
+                print("🔄 Account change trigger detected!")
+                self.last_trigger_check = mtime
+
+                # Delete trigger file
+                try:
+                    os.remove(trigger_file)
+                    print("🗑️  Trigger file deleted")
+                except Exception as e:
+                    print(f"Error deleting trigger file: {e}")
+
+                # Update token
+                print("🔄 Updating token...")
+                self.update_active_token()
+                return True
             return False
         except Exception as e:
             print(f"Trigger check error: {e}")
@@ -226,26 +229,25 @@ class WarpProxyHandler:
                 new_token_data = {
                     'accessToken': token_data['access_token'],
                     'refreshToken': token_data['refresh_token'],
-                    'expirationTime': int(time.time() * 1000) + (int(token_data['expires_in']) * 1000)
+                    'expirationTime': time.time_ns() // 1_000_000 + (int(token_data['expires_in']) * 1000)
                 }
 
-                # Update database
+                # Update database; SQLite patches the token fields inside account_data in place
                 conn = sqlite3.connect(self.db_path)
                 cursor = conn.cursor()
-                cursor.execute('SELECT account_data FROM accounts WHERE email = ?', (email,))
-                result = cursor.fetchone()
-
-                if result:
-                    account_data = json.loads(result[0])
-                    account_data['stsTokenManager'].update(new_token_data)
-
-                    cursor.execute('''
-                        UPDATE accounts SET account_data = ?, last_updated = CURRENT_TIMESTAMP
-                        WHERE email = ?
-                    ''', (json.dumps(account_data), email))
-                    conn.commit()
-
+                cursor.execute('''
+                    UPDATE accounts
+                    SET account_data = json_set(account_data,
+                                                '$.stsTokenManager.accessToken', ?,
+                                                '$.stsTokenManager.refreshToken', ?,
+                                                '$.stsTokenManager.expirationTime', ?),
+                        expiration_time = ?, last_updated = CURRENT_TIMESTAMP
+                    WHERE email = ? AND json_type(account_data, '$.stsTokenManager') = 'object'
+                ''', (new_token_data['accessToken'], new_token_data['refreshToken'],
+                      new_token_data['expirationTime'], new_token_data['expirationTime'], email))
+                conn.commit()
                 conn.close()
+                self.notify_gui_about_token_change(email)
                 return True
             return False
         except Exception as e:
@@ -296,15 +298,29 @@ class WarpProxyHandler:
             import os
             import time
 
-            # Create ban notification file
+            # Create ban notification file (written aside and renamed, so the GUI never sees it half-written)
             ban_notification_file = "ban_notification.tmp"
-            with open(ban_notification_file, 'w', encoding='utf-8') as f:
+            with open(ban_notification_file + ".part", 'w', encoding='utf-8') as f:
                 f.write(f"{email}|{int(time.time())}")
+            os.replace(ban_notification_file + ".part", ban_notification_file)
 
             print(f"Ban notification file created: {ban_notification_file}")
         except Exception as e:
             print(f"Error sending ban notification: {e}")
 
+    def notify_gui_about_token_change(self, email):
+        """Tell the GUI that an account token was refreshed, via file"""
+        try:
+            import os
+
+            # Written aside and renamed, so the GUI never sees it half-written
+            token_change_file = "token_change.tmp"
+            with open(token_change_file + ".part", 'w', encoding='utf-8') as f:
+                f.write(f"{email}|{int(time.time())}")
+            os.replace(token_change_file + ".part", token_change_file)
+        except Exception as e:
+            print(f"Error sending token change notification: {e}")
+
     def load_user_settings(self):
         """Load user_settings.json file"""
         try:
@@ -72,13 +72,13 @@ class AccountProcessor:
             
             # Use user_info data if available for more accurate account details
             if user_info:
-                created_at = user_info.get('createdAt', str(int(time.time() * 1000)))
-                last_login_at = user_info.get('lastLoginAt', str(int(time.time() * 1000)))
+                created_at = user_info.get('createdAt', str(time.time_ns() // 1_000_000))
+                last_login_at = user_info.get('lastLoginAt', str(time.time_ns() // 1_000_000))
                 email_verified = user_info.get('emailVerified', True)
                 display_name = user_info.get('displayName')  # Get displayName from user_info
             else:
-                created_at = str(int(time.time() * 1000))
-                last_login_at = str(int(time.time() * 1000))
+                created_at = str(time.time_ns() // 1_000_000)
+                last_login_at = str(time.time_ns() // 1_000_000)
                 email_verified = True
                 display_name = None
                     
@@ -103,7 +103,7 @@ class AccountProcessor:
                 "stsTokenManager": {
                     "refreshToken": refresh_token,
                     "accessToken": id_token,
-                    "expirationTime": int(time.time() * 1000) + (int(expires_in) * 1000)
+                    "expirationTime": time.time_ns() // 1_000_000 + (int(expires_in) * 1000)
                 },
                 "createdAt": created_at,
                 "lastLoginAt": last_login_at,
@@ -116,7 +116,7 @@ class AccountProcessor:
             logging.debug(f"ID Token: {id_token[:50] if id_token else 'None'}...")
             logging.debug(f"Used full account info: {'Yes' if user_info else 'No'}")
             
-            return json.dumps(firebase_account, ensure_ascii=False)
+            return json.dumps(firebase_account, separators=(',', ':'), ensure_ascii=False)
             
         except Exception as e:
             logging.error(f"Account format conversion error: {e}")
@@ -179,7 +179,7 @@ class AccountProcessor:
             if isinstance(expiration_time, str):
                 expiration_time = int(expiration_time)
             
-            current_time = int(time.time() * 1000)
+            current_time = time.time_ns() // 1_000_000
             return current_time >= expiration_time
             
         except Exception as e:
@@ -282,7 +282,7 @@ class AccountProcessor:
         """Create a backup copy of account data with timestamp"""
         try:
             backup = {
-                'timestamp': int(time.time() * 1000),
+                'timestamp': time.time_ns() // 1_000_000,
                 'backup_version': '1.0',
                 'account_data': account_data.copy()
             }
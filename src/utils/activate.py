@@ -24,17 +24,19 @@ def activate_first_healthy_account():
     conn = None
     try:
         conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        # Pick the first non-banned account and make it active in one statement;
+        # the connection context manager commits on success
+        with conn:
+            cursor = conn.execute('''
+                INSERT OR REPLACE INTO proxy_settings (key, value)
+                SELECT 'active_account', email FROM accounts
+                WHERE health_status != 'banned' LIMIT 1
+            ''')
 
-        # Get first healthy account
-        cursor.execute('SELECT email FROM accounts WHERE health_status != "banned" LIMIT 1')
-        result = cursor.fetchone()
-
-        if result:
-            email = result[0]
-            # Set as active account
-            cursor.execute('INSERT OR REPLACE INTO proxy_settings (key, value) VALUES ("active_account", ?)', (email,))
-            conn.commit()
+        if cursor.rowcount:
+            email = conn.execute(
+                'SELECT value FROM proxy_settings WHERE key = ?', ('active_account',)
+            ).fetchone()[0]
             print(f'✅ Account activated: {email}')
             return True
         else:
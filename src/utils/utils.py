@@ -6,9 +6,41 @@ Utility functions for the application
 """
 
 import os
+import ssl
+import json
 import socket
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from src.config.languages import _
 
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fastest available JSON parser (accepts str or bytes)
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# One unverified SSLContext shared by every pooled HTTPS connection
+_SSL_CTX = ssl._create_unverified_context()
+
+
+class _PreloadedSSLAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools reuse _SSL_CTX instead of building a context each time"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _SSL_CTX
+        return super().init_poolmanager(*args, **kwargs)
+
 
 def load_stylesheet(app):
     """Apply modern dark theme style"""
@@ -66,19 +98,19 @@ def is_port_open(host, port):
         return False
 
 
+@lru_cache(maxsize=1)
 def get_os_info():
-    """Get operating system information for API headers"""
-    # Use the modular proxy manager approach
+    """Get operating system information for API headers (probed once per process)"""
+    # Use the modular proxy manager approach; only the current platform's module is imported
     import sys
-    from src.proxy.proxy_windows import WindowsProxyManager
-    from src.proxy.proxy_macos import MacOSProxyManager
-    from src.proxy.proxy_linux import LinuxProxyManager
-    
     if sys.platform == "win32":
+        from src.proxy.proxy_windows import WindowsProxyManager
         return WindowsProxyManager.get_os_info()
     elif sys.platform == "darwin":
+        from src.proxy.proxy_macos import MacOSProxyManager
         return MacOSProxyManager.get_os_info()
     else:
+        from src.proxy.proxy_linux import LinuxProxyManager
         return LinuxProxyManager.get_os_info()
 
 
@@ -5,27 +5,144 @@
 Background worker threads for account operations
 """
 
-import sys
 import json
 import time
 import logging
 import requests
+import urllib3
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Optional
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThread, pyqtSignal
 from src.config.languages import _
 from src.managers.database_manager import DatabaseManager
-
-
-class TokenWorker(QThread):
-    """Single token refresh in background"""
+from src.utils.utils import get_os_info, json_loads, json_dumps, _PreloadedSSLAdapter
+
+
+# Workers talk to Warp/Firebase with verify=False; silence the per-request warning once
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Keep-alive session shared by single token refreshes
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', _PreloadedSSLAdapter(max_retries=Retry(total=2, backoff_factor=0.2)))
+_HTTP_SESSION.verify = False
+
+
+# GetRequestLimitInfo request used by the limit checks here and in MainWindow (whitespace collapsed once at import)
+_GET_REQUEST_LIMIT_INFO_QUERY = " ".join("""query GetRequestLimitInfo($requestContext: RequestContext!) {
+  user(requestContext: $requestContext) {
+    __typename
+    ... on UserOutput {
+      user {
+        requestLimitInfo {
+          isUnlimited
+          nextRefreshTime
+          requestLimit
+          requestsUsedSinceLastRefresh
+          requestLimitRefreshDuration
+          isUnlimitedAutosuggestions
+          acceptedAutosuggestionsLimit
+          acceptedAutosuggestionsSinceLastRefresh
+          isUnlimitedVoice
+          voiceRequestLimit
+          voiceRequestsUsedSinceLastRefresh
+          voiceTokenLimit
+          voiceTokensUsedSinceLastRefresh
+          isUnlimitedCodebaseIndices
+          maxCodebaseIndices
+          maxFilesPerRepo
+          embeddingGenerationBatchSize
+        }
+      }
+    }
+    ... on UserFacingError {
+      error {
+        __typename
+        ... on SharedObjectsLimitExceeded {
+          limit
+          objectType
+          message
+        }
+        ... on PersonalObjectsLimitExceeded {
+          limit
+          objectType
+          message
+        }
+        ... on AccountDelinquencyError {
+          message
+        }
+        ... on GenericStringObjectUniqueKeyConflict {
+          message
+        }
+      }
+      responseContext {
+        serverVersion
+      }
+    }
+  }
+}""".split())
+
+# Per-process part of the GetRequestLimitInfo headers; auth and OS headers are added per call
+_LIMIT_INFO_HEADERS = {
+    'Content-Type': 'application/json',
+    'x-warp-client-version': 'v0.2025.08.27.08.11.stable_04',
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'x-warp-manager-request': 'true'
+}
+
+
+@lru_cache(maxsize=1)
+def _limit_info_body(os_category, os_version):
+    """JSON body of the GetRequestLimitInfo request; it only depends on the host OS, so it is built once"""
+    return json_dumps({
+        "query": _GET_REQUEST_LIMIT_INFO_QUERY,
+        "variables": {
+            "requestContext": {
+                "clientContext": {"version": "v0.2025.08.27.08.11.stable_04"},
+                "osContext": {"category": os_category, "linuxKernelVersion": None, "name": os_category, "version": os_version}
+            }
+        },
+        "operationName": "GetRequestLimitInfo"
+    })
+
+
+@lru_cache(maxsize=128)
+def limit_info_request(access_token):
+    """(headers, body) of the GetRequestLimitInfo request for one access token"""
+    # Keyed by token: a renewed token gets a fresh entry and old ones age out
+    os_info = get_os_info()
+    headers = {
+        **_LIMIT_INFO_HEADERS,
+        'Authorization': f'Bearer {access_token}',
+        'x-warp-os-category': os_info['category'],
+        'x-warp-os-name': os_info['name'],
+        'x-warp-os-version': os_info['version'],
+    }
+    return headers, _limit_info_body(os_info['category'], os_info['version'])
+
+
+class _TokenWorkerSignals(QObject):
+    """Signals for TokenWorker (a QRunnable cannot emit on its own)"""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)  # success, message
     error = pyqtSignal(str)
 
+
+class TokenWorker(QRunnable):
+    """Single token refresh in background, run on the shared thread pool"""
+
     def __init__(self, email, account_data, proxy_enabled=False):
         super().__init__()
+        self.signals = _TokenWorkerSignals()
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+        self.error = self.signals.error
         self.email = email
         self.account_data = account_data
         self.account_manager = DatabaseManager()
@@ -62,14 +179,14 @@ class TokenWorker(QThread):
             }
 
             # Direct connection - completely bypass proxy
-            response = requests.post(url, json=data, headers=headers, timeout=30, verify=False)
+            response = _HTTP_SESSION.post(url, json=data, headers=headers, timeout=30)
 
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = json_loads(response.content)
                 new_token_data = {
                     'accessToken': token_data['access_token'],
                     'refreshToken': token_data['refresh_token'],
-                    'expirationTime': int(time.time() * 1000) + (int(token_data['expires_in']) * 1000)
+                    'expirationTime': time.time_ns() // 1_000_000 + (int(token_data['expires_in']) * 1000)
                 }
 
                 return self.account_manager.update_account_token(self.email, new_token_data)
@@ -79,79 +196,105 @@ class TokenWorker(QThread):
             return False
 
 
-class TokenRefreshWorker(QThread):
-    """Bulk token refresh and limit information retrieval in background"""
+class _TokenRefreshSignals(QObject):
+    """Signals for TokenRefreshWorker"""
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
+
+class TokenRefreshWorker(QRunnable):
+    """Bulk token refresh and limit information retrieval in background, run on the shared thread pool"""
+
+    # Upper bound on concurrent Warp/Firebase requests during a bulk refresh
+    MAX_PARALLEL_REQUESTS = 8
+
     def __init__(self, accounts, proxy_enabled=False):
         super().__init__()
+        self.signals = _TokenRefreshSignals()
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+        self.error = self.signals.error
         self.accounts = accounts
         self.account_manager = DatabaseManager()
         self.proxy_enabled = proxy_enabled
+        # Shared by the parallel requests; sized so every worker keeps its connection alive
+        self.session = requests.Session()
+        self.session.mount('https://', _PreloadedSSLAdapter(pool_maxsize=self.MAX_PARALLEL_REQUESTS,
+                                                            max_retries=Retry(total=2, backoff_factor=0.2)))
+        self.session.verify = False
 
     def run(self):
-        results = []
         total_accounts = len(self.accounts)
+        results = [None] * total_accounts
+        done = 0
 
-        for i, (email, account_json, health_status) in enumerate(self.accounts):
-            try:
-                self.progress.emit(int((i / total_accounts) * 100), _('processing_account', email))
+        # Accounts are independent, so their requests run side by side on one connection pool
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as executor:
+                futures = {
+                    executor.submit(self._refresh_one, email, account_json, health_status): i
+                    for i, (email, account_json, health_status) in enumerate(self.accounts)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    done += 1
+                    self.progress.emit(int((done / total_accounts) * 100), _('processing_account', results[i][0]))
+        finally:
+            self.session.close()
 
-                # Skip banned accounts
-                if health_status == _('status_banned_key'):
-                    self.account_manager.update_account_limit_info(email, _('status_na'))
-                    results.append((email, _('status_banned'), _('status_na')))
-                    continue
-
-                account_data = json.loads(account_json)
-
-                # Check token expiration
-                expiration_time = account_data['stsTokenManager']['expirationTime']
-                # Convert to int if string
-                if isinstance(expiration_time, str):
-                    expiration_time = int(expiration_time)
-                current_time = int(time.time() * 1000)
-
-                if current_time >= expiration_time:
-                    # Token expired, refresh it
-                    self.progress.emit(int((i / total_accounts) * 100), _('refreshing_token', email))
-                    if not self.refresh_token(email, account_data):
-                        # Failed to refresh token - mark as unhealthy
-                        self.account_manager.update_account_health(email, _('status_unhealthy'))
-                        self.account_manager.update_account_limit_info(email, _('status_na'))
-                        results.append((email, _('token_refresh_failed', email), _('status_na')))
-                        continue
-
-                    # Get updated account_data
-                    updated_accounts = self.account_manager.get_accounts()
-                    for updated_email, updated_json in updated_accounts:
-                        if updated_email == email:
-                            account_data = json.loads(updated_json)
-                            break
-
-                # Get limit information
-                limit_info = self.get_limit_info(account_data)
-                if limit_info and isinstance(limit_info, dict):
-                    used = limit_info.get('requestsUsedSinceLastRefresh', 0)
-                    total = limit_info.get('requestLimit', 0)
-                    limit_text = f"{used}/{total}"
-                    # Success - mark as healthy and save limit info
-                    self.account_manager.update_account_health(email, _('status_healthy'))
-                    self.account_manager.update_account_limit_info(email, limit_text)
-                    results.append((email, _('success'), limit_text))
-                else:
-                    # Failed to get limit info - mark as unhealthy
-                    self.account_manager.update_account_health(email, _('status_unhealthy'))
-                    self.account_manager.update_account_limit_info(email, _('status_na'))
-                    results.append((email, _('limit_info_failed'), _('status_na')))
+        self.finished.emit(results)
 
-            except Exception as e:
+    def _refresh_one(self, email, account_json, health_status):
+        """Refresh token (if expired) and limit information for one account; returns (email, status, limit_text)"""
+        try:
+            # Skip banned accounts
+            if health_status == _('status_banned_key'):
                 self.account_manager.update_account_limit_info(email, _('status_na'))
-                results.append((email, f"{_('error')}: {str(e)}", _('status_na')))
+                return (email, _('status_banned'), _('status_na'))
 
-        self.finished.emit(results)
+            account_data = json_loads(account_json)
+
+            # Check token expiration
+            expiration_time = account_data['stsTokenManager']['expirationTime']
+            # Convert to int if string
+            if isinstance(expiration_time, str):
+                expiration_time = int(expiration_time)
+            current_time = time.time_ns() // 1_000_000
+
+            if current_time >= expiration_time:
+                # Token expired, refresh it
+                if not self.refresh_token(email, account_data):
+                    # Failed to refresh token - mark as unhealthy
+                    self.account_manager.update_account_health(email, _('status_unhealthy'))
+                    self.account_manager.update_account_limit_info(email, _('status_na'))
+                    return (email, _('token_refresh_failed', email), _('status_na'))
+
+                # Get updated account_data
+                row = self.account_manager.get_account_with_health(email)
+                if row:
+                    account_data = json_loads(row[0])
+
+            # Get limit information
+            limit_info = self.get_limit_info(account_data)
+            if limit_info and isinstance(limit_info, dict):
+                used = limit_info.get('requestsUsedSinceLastRefresh', 0)
+                total = limit_info.get('requestLimit', 0)
+                limit_text = f"{used}/{total}"
+                # Success - mark as healthy and save limit info
+                self.account_manager.update_account_health(email, _('status_healthy'))
+                self.account_manager.update_account_limit_info(email, limit_text)
+                return (email, _('success'), limit_text)
+
+            # Failed to get limit info - mark as unhealthy
+            self.account_manager.update_account_health(email, _('status_unhealthy'))
+            self.account_manager.update_account_limit_info(email, _('status_na'))
+            return (email, _('limit_info_failed'), _('status_na'))
+
+        except Exception as e:
+            self.account_manager.update_account_limit_info(email, _('status_na'))
+            return (email, f"{_('error')}: {str(e)}", _('status_na'))
 
     def refresh_token(self, email, account_data):
         """Refresh Firebase token"""
@@ -170,14 +313,14 @@ class TokenRefreshWorker(QThread):
             }
 
             # Direct connection - completely bypass proxy
-            response = requests.post(url, json=data, headers=headers, timeout=30, verify=False)
+            response = self.session.post(url, json=data, headers=headers, timeout=30)
 
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = json_loads(response.content)
                 new_token_data = {
                     'accessToken': token_data['access_token'],
                     'refreshToken': token_data['refresh_token'],
-                    'expirationTime': int(time.time() * 1000) + (int(token_data['expires_in']) * 1000)
+                    'expirationTime': time.time_ns() // 1_000_000 + (int(token_data['expires_in']) * 1000)
                 }
 
                 return self.account_manager.update_account_token(email, new_token_data)
@@ -191,110 +334,14 @@ class TokenRefreshWorker(QThread):
         try:
             access_token = account_data['stsTokenManager']['accessToken']
 
-            # Get dynamic OS information from proxy manager
-            from src.proxy.proxy_windows import WindowsProxyManager
-            from src.proxy.proxy_macos import MacOSProxyManager  
-            from src.proxy.proxy_linux import LinuxProxyManager
-            
-            if sys.platform == "win32":
-                os_info = WindowsProxyManager.get_os_info()
-            elif sys.platform == "darwin":
-                os_info = MacOSProxyManager.get_os_info()
-            else:
-                os_info = LinuxProxyManager.get_os_info()
-            
             url = "https://app.warp.dev/graphql/v2?op=GetRequestLimitInfo"
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {access_token}',
-                'x-warp-client-version': 'v0.2025.08.27.08.11.stable_04',
-                'x-warp-os-category': os_info['category'],
-                'x-warp-os-name': os_info['name'],
-                'x-warp-os-version': os_info['version'],
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'x-warp-manager-request': 'true'  # Request from our application
-            }
-
-            query = """
-            query GetRequestLimitInfo($requestContext: RequestContext!) {
-              user(requestContext: $requestContext) {
-                __typename
-                ... on UserOutput {
-                  user {
-                    requestLimitInfo {
-                      isUnlimited
-                      nextRefreshTime
-                      requestLimit
-                      requestsUsedSinceLastRefresh
-                      requestLimitRefreshDuration
-                      isUnlimitedAutosuggestions
-                      acceptedAutosuggestionsLimit
-                      acceptedAutosuggestionsSinceLastRefresh
-                      isUnlimitedVoice
-                      voiceRequestLimit
-                      voiceRequestsUsedSinceLastRefresh
-                      voiceTokenLimit
-                      voiceTokensUsedSinceLastRefresh
-                      isUnlimitedCodebaseIndices
-                      maxCodebaseIndices
-                      maxFilesPerRepo
-                      embeddingGenerationBatchSize
-                    }
-                  }
-                }
-                ... on UserFacingError {
-                  error {
-                    __typename
-                    ... on SharedObjectsLimitExceeded {
-                      limit
-                      objectType
-                      message
-                    }
-                    ... on PersonalObjectsLimitExceeded {
-                      limit
-                      objectType
-                      message
-                    }
-                    ... on AccountDelinquencyError {
-                      message
-                    }
-                    ... on GenericStringObjectUniqueKeyConflict {
-                      message
-                    }
-                  }
-                  responseContext {
-                    serverVersion
-                  }
-                }
-              }
-            }
-            """
-
-            payload = {
-                "query": query,
-                "variables": {
-                    "requestContext": {
-                        "clientContext": {
-                            "version": "v0.2025.08.27.08.11.stable_04"
-                        },
-                        "osContext": {
-                            "category": os_info['category'],
-                            "linuxKernelVersion": None,
-                            "name": os_info['category'],
-                            "version": os_info['version']
-                        }
-                    }
-                },
-                "operationName": "GetRequestLimitInfo"
-            }
+            headers, body = limit_info_request(access_token)
 
             # Direct connection - completely bypass proxy
-            response = requests.post(url, headers=headers, json=payload, timeout=30, verify=False)
+            response = self.session.post(url, headers=headers, data=body, timeout=30)
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 if 'data' in data and data['data'] and 'user' in data['data']:
                     user_data = data['data']['user']
                     if user_data and user_data.get('__typename') == 'UserOutput':
@@ -310,7 +357,7 @@ class TokenRefreshWorker(QThread):
 
 class AccountCreationWorker(QThread):
     """Temporary email and account creation in background"""
-    progress = pyqtSignal(str)
+    progress = pyqtSignal(int, str)  # percent, message
     finished = pyqtSignal(dict)  # result dict with email data
     error = pyqtSignal(str)
     
@@ -320,7 +367,7 @@ class AccountCreationWorker(QThread):
     
     def run(self):
         try:
-            self.progress.emit("Initializing temporary email creation...")
+            self.progress.emit(0, "Initializing temporary email creation...")
             
             # Check module availability
             try:
@@ -330,17 +377,17 @@ class AccountCreationWorker(QThread):
                 # Check proxy availability
                 proxy_file_path = "proxy.txt"
                 if os.path.exists(proxy_file_path):
-                    self.progress.emit("Checking proxy from proxy.txt...")
+                    self.progress.emit(10, "Checking proxy from proxy.txt...")
                 
                 # Run automatic Warp.dev account creation
-                self.progress.emit("Creating temporary email address...")
+                self.progress.emit(20, "Creating temporary email address...")
                 
                 # Create new event loop for this thread
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
                 
                 try:
-                    self.progress.emit("Sending verification code...")
+                    self.progress.emit(30, "Sending verification code...")
                     result = loop.run_until_complete(create_warp_account_automatically(proxy_file_path))
                     
                     if result:
@@ -353,7 +400,7 @@ class AccountCreationWorker(QThread):
                             return
                         
                         # Successful account creation
-                        self.progress.emit(f"Account created: {result['email']}")
+                        self.progress.emit(80, f"Account created: {result['email']}")
                         
                         # Convert result to format for database saving
                         account_json = self._convert_to_account_format(result)
@@ -363,16 +410,16 @@ class AccountCreationWorker(QThread):
                             success, message = account_manager.add_account(account_json)
                             
                             if success:
-                                self.progress.emit(f"✅ Account added to database: {result['email']}")
+                                self.progress.emit(100, f"✅ Account added to database: {result['email']}")
                                 # Return result with save information
                                 result['saved_to_database'] = True
                                 result['save_message'] = message
                             else:
-                                self.progress.emit(f"❌ Save error: {message}")
+                                self.progress.emit(100, f"❌ Save error: {message}")
                                 result['saved_to_database'] = False
                                 result['save_message'] = message
                         else:
-                            self.progress.emit("❌ Account data conversion error")
+                            self.progress.emit(100, "❌ Account data conversion error")
                             result['saved_to_database'] = False
                             result['save_message'] = "Account data conversion error"
                         
@@ -417,13 +464,13 @@ class AccountCreationWorker(QThread):
             
             # Use user_info data if available for more accurate account details
             if user_info:
-                created_at = user_info.get('createdAt', str(int(time.time() * 1000)))
-                last_login_at = user_info.get('lastLoginAt', str(int(time.time() * 1000)))
+                created_at = user_info.get('createdAt', str(time.time_ns() // 1_000_000))
+                last_login_at = user_info.get('lastLoginAt', str(time.time_ns() // 1_000_000))
                 email_verified = user_info.get('emailVerified', True)
                 display_name = user_info.get('displayName')  # Get displayName from user_info
             else:
-                created_at = str(int(time.time() * 1000))
-                last_login_at = str(int(time.time() * 1000))
+                created_at = str(time.time_ns() // 1_000_000)
+                last_login_at = str(time.time_ns() // 1_000_000)
                 email_verified = True
                 display_name = None
                     
@@ -448,7 +495,7 @@ class AccountCreationWorker(QThread):
                 "stsTokenManager": {
                     "refreshToken": refresh_token,
                     "accessToken": id_token,
-                    "expirationTime": int(time.time() * 1000) + (int(expires_in) * 1000)
+                    "expirationTime": time.time_ns() // 1_000_000 + (int(expires_in) * 1000)
                 },
                 "createdAt": created_at,
                 "lastLoginAt": last_login_at,
@@ -461,7 +508,7 @@ class AccountCreationWorker(QThread):
             logging.debug(f"ID Token: {id_token[:50] if id_token else 'None'}...")
             logging.debug(f"Used full account information: {'Yes' if user_info else 'No'}")
             
-            return json.dumps(firebase_account, ensure_ascii=False)
+            return json.dumps(firebase_account, separators=(',', ':'), ensure_ascii=False)
             
         except Exception as e:
             logging.error(f"Account format conversion error: {e}")